@@ -1,5 +1,11 @@
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 import streamlit as st
 import altair as alt
 
@@ -24,25 +30,83 @@ load_custom_css("assets/style.css")
 # ------------------------
 # Data Loading
 # ------------------------
+# Columns each dataset feeds into the page; anything else (e.g. the
+# unnamed index column left by to_csv) is skipped during the scan
+DATASET_COLUMNS = {
+    "before_after_ace": ["month_dt", "Route ID", "is_ACE", "Average Road Speed", "Average Travel Time"],
+    "top5": ["Route ID", "False", "True", "Pct Change"],
+}
+
+# Types applied while the CSV is scanned: month_dt is parsed in place,
+# route ids become categoricals and speeds/times fit in float32
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+COLUMN_TYPES = {
+    "month_dt": pa.timestamp("s"),
+    "Route ID": CATEGORY,
+    "Average Road Speed": pa.float32(),
+    "Average Travel Time": pa.float32(),
+}
+TIMESTAMP_PARSERS = ["%Y-%m"]
+
+def write_parquet(table: pa.Table, parquet_path: str) -> None:
+    # Best effort: written to a temp file and swapped in so concurrent
+    # sessions never read a partial file; skipped on a read-only data dir
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(parquet_path))
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, parquet_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        pass
+
+def read_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    # The parsed table is kept as Parquet beside the CSV and reused until
+    # the CSV or this page (column lists, types) is modified
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    source_mtime = max(os.path.getmtime(path), os.path.getmtime(__file__))
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= source_mtime:
+        table = pq.read_table(parquet_path)
+    else:
+        convert_options = pa_csv.ConvertOptions(
+            column_types=COLUMN_TYPES,
+            timestamp_parsers=TIMESTAMP_PARSERS,
+            include_columns=columns or [],
+        )
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+        write_parquet(table, parquet_path)
+
+    # One block per column and release Arrow buffers as they are handed
+    # over, instead of consolidating into fresh 2D blocks
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
 @st.cache_data
-def load_csv(dataset_name: str) -> pd.DataFrame:
+def load_csvs(dataset_names: tuple, max_workers: int = 4) -> List[pd.DataFrame]:
     base_dir = os.path.dirname(os.path.dirname(__file__))  # Dashboards/
     data_dir = os.path.join(base_dir, "data")             # Dashboards/data/
-    path = os.path.join(data_dir, f"{dataset_name}.csv")
+    paths = [os.path.join(data_dir, f"{name}.csv") for name in dataset_names]
+    columns = [DATASET_COLUMNS.get(name) for name in dataset_names]
 
-    if not os.path.exists(path):
-        st.error(f"❌ Dataset '{path}' not found!")
-        return pd.DataFrame()
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        st.error("❌ Datasets not found: " + ", ".join(f"'{path}'" for path in missing))
 
-    df = pd.read_csv(path)
-    if "month_dt" in df.columns:
-        df['month_dt'] = pd.to_datetime(df['month_dt'])
-    return df
+    # pyarrow parses outside the GIL, so the files are read side by side
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_csv, paths, columns))
 
 # ------------------------
 # Visualization Functions
 # ------------------------
-def plot_before_after_ace(df: pd.DataFrame, metric: str) -> alt.Chart:
+def plot_before_after_ace(df: pd.DataFrame, metric: str) -> Optional[alt.Chart]:
     if df.empty:
         return None
 
@@ -70,7 +134,7 @@ def plot_before_after_ace(df: pd.DataFrame, metric: str) -> alt.Chart:
     )
     return chart
 
-def plot_top_bottom_routes(df: pd.DataFrame) -> alt.Chart:
+def plot_top_bottom_routes(df: pd.DataFrame) -> Optional[alt.Chart]:
     if df.empty:
         return None
 
@@ -113,8 +177,7 @@ def plot_top_bottom_routes(df: pd.DataFrame) -> alt.Chart:
 # Main Page
 # ------------------------
 def main():
-    df = load_csv("before_after_ace")
-    top_routes_df = load_csv("top5")
+    df, top_routes_df = load_csvs(("before_after_ace", "top5"))
     if df.empty:
         st.stop()
 
@@ -126,7 +189,7 @@ def main():
     filter_col1, filter_col2 = st.columns(2)
 
     with filter_col1:
-        route_options = sorted(df["Route ID"].dropna().unique().tolist())
+        route_options = sorted(df["Route ID"].cat.categories.tolist())
         selected_route = st.selectbox("🚌 Select Bus Route", route_options)
 
     with filter_col2:
@@ -136,7 +199,7 @@ def main():
     # ------------------------
     # Apply Filters
     # ------------------------
-    filtered = df.copy()
+    filtered = df
     if selected_route != "All":
         filtered = filtered[filtered["Route ID"] == selected_route]
 
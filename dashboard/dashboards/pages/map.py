@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 import streamlit as st
 import pandas as pd
 
@@ -11,7 +12,7 @@ st.set_page_config(
 )
 
 
-def load_map() -> str:
+def load_map() -> Optional[str]:
     base_dir = os.path.dirname(os.path.dirname(__file__))  # Dashboards/
     data_dir = os.path.join(base_dir, "data")
     map_file = os.path.join(data_dir, "bus_map.html")
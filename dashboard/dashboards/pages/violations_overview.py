@@ -1,5 +1,11 @@
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
 import streamlit as st
 import altair as alt
 
@@ -24,24 +30,86 @@ load_custom_css("assets/style.css")
 # ------------------------
 # Data Loading
 # ------------------------
+# Columns each dataset feeds into the page; anything else (e.g. the
+# unnamed index column left by to_csv) is skipped during the scan
+DATASET_COLUMNS = {
+    "weekday_counts": ["weekday", "month", "bus_route_id", "violation_type", "violations"],
+    "hourly_counts": ["hour", "weekday", "month", "bus_route_id", "violation_type", "violations"],
+    "stop_counts": ["stop_name", "bus_route_id", "month", "weekday", "violation_type", "violations"],
+}
+
+# Types applied while the CSV is scanned: low-cardinality keys become
+# categoricals and the counts fit in narrow integers
+CATEGORY = pa.dictionary(pa.int32(), pa.string())
+COLUMN_TYPES = {
+    "weekday": CATEGORY,
+    "month": CATEGORY,
+    "bus_route_id": CATEGORY,
+    "violation_type": CATEGORY,
+    "hour": pa.int8(),
+    "violations": pa.int32(),
+}
+
+def write_parquet(table: pa.Table, parquet_path: str) -> None:
+    # Best effort: written to a temp file and swapped in so concurrent
+    # sessions never read a partial file; skipped on a read-only data dir
+    try:
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(parquet_path))
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, parquet_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        pass
+
+def read_csv(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    # The parsed table is kept as Parquet beside the CSV and reused until
+    # the CSV or this page (column lists, types) is modified
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    source_mtime = max(os.path.getmtime(path), os.path.getmtime(__file__))
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= source_mtime:
+        table = pq.read_table(parquet_path)
+    else:
+        convert_options = pa_csv.ConvertOptions(
+            column_types=COLUMN_TYPES,
+            include_columns=columns or [],
+        )
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+        write_parquet(table, parquet_path)
+
+    # One block per column and release Arrow buffers as they are handed
+    # over, instead of consolidating into fresh 2D blocks
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
 @st.cache_data
-def load_csv(dataset_name: str) -> pd.DataFrame:
+def load_csvs(dataset_names: tuple, max_workers: int = 4) -> List[pd.DataFrame]:
     # Always resolve relative to repo root
     base_dir = os.path.dirname(os.path.dirname(__file__))  # Dashboards/
     data_dir = os.path.join(base_dir, "data")             # Dashboards/data/
-    path = os.path.join(data_dir, f"{dataset_name}.csv")
+    paths = [os.path.join(data_dir, f"{name}.csv") for name in dataset_names]
+    columns = [DATASET_COLUMNS.get(name) for name in dataset_names]
 
-    if not os.path.exists(path):
-        st.error(f"❌ Dataset '{path}' not found!")
-        return pd.DataFrame()
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        st.error("❌ Datasets not found: " + ", ".join(f"'{path}'" for path in missing))
 
-    return pd.read_csv(path)
+    # pyarrow parses outside the GIL, so the files are read side by side
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_csv, paths, columns))
 
 
 # ------------------------
 # Visualization Functions
 # ------------------------
-def plot_weekday_violations(df: pd.DataFrame) -> alt.Chart:
+def plot_weekday_violations(df: pd.DataFrame) -> Optional[alt.Chart]:
     if df.empty:
         return None
 
@@ -62,7 +130,7 @@ def plot_weekday_violations(df: pd.DataFrame) -> alt.Chart:
     return (bars + text).properties(height=400, title="Violations by Day of the Week")
 
 
-def plot_hourly_violations(df: pd.DataFrame) -> alt.Chart:
+def plot_hourly_violations(df: pd.DataFrame) -> Optional[alt.Chart]:
     if df.empty:
         return None
 
@@ -77,7 +145,7 @@ def plot_hourly_violations(df: pd.DataFrame) -> alt.Chart:
 # ------------------------
 # Heatmap Function
 # ------------------------
-def plot_weekday_hour_heatmap(df: pd.DataFrame) -> alt.Chart:
+def plot_weekday_hour_heatmap(df: pd.DataFrame) -> Optional[alt.Chart]:
     if df.empty:
         return None
 
@@ -104,10 +172,9 @@ def plot_weekday_hour_heatmap(df: pd.DataFrame) -> alt.Chart:
 # ------------------------
 def main():
     # Load datasets
-    weekday_counts = load_csv("weekday_counts")
-    hourly_counts  = load_csv("hourly_counts")
-    monthly_counts = load_csv("monthly_counts")
-    stop_counts    = load_csv("stop_counts")
+    weekday_counts, hourly_counts, stop_counts = load_csvs(
+        ("weekday_counts", "hourly_counts", "stop_counts")
+    )
 
     st.title("📊 NYC Bus Violations Overview")
 
@@ -116,9 +183,11 @@ def main():
     # ------------------------
     filter_col1, filter_col2, filter_col3 , filter_col4= st.columns(4)
 
+    # Keys are read as categoricals, so their categories already hold the
+    # distinct values and no column scan is needed on each rerun
     with filter_col1:
-        month_options = ["All"] + sorted(weekday_counts["month"].dropna().unique().tolist(),
-                                  key=lambda x: pd.to_datetime(x, format="%Y-%m"),
+        # "YYYY-MM" strings already sort chronologically
+        month_options = ["All"] + sorted(weekday_counts["month"].cat.categories.tolist(),
                                   reverse=True
                                   )
 
@@ -129,23 +198,21 @@ def main():
         selected_weekday = st.selectbox("📆 Filter by Weekday", weekday_options, index=0)
 
     with filter_col3:
-        route_options = ["All"] + sorted(weekday_counts["bus_route_id"].dropna().unique().tolist())
+        route_options = ["All"] + sorted(weekday_counts["bus_route_id"].cat.categories.tolist())
         selected_route = st.selectbox("🚌 Filter by Bus Route", route_options, index=0)
 
     with filter_col4:
-        violation_options = ["All"] + sorted(weekday_counts["violation_type"].dropna().unique().tolist())
+        violation_options = ["All"] + sorted(weekday_counts["violation_type"].cat.categories.tolist())
         selected_violation = st.selectbox("⚠️ Filter by Violation Type", violation_options, index=0)
     # ------------------------
     # Apply Filters
     # ------------------------
-    filtered_weekday = weekday_counts.copy()
-    filtered_hourly = hourly_counts.copy()
-    filtered_monthly = monthly_counts.copy()
+    filtered_weekday = weekday_counts
+    filtered_hourly = hourly_counts
 
     if selected_month != "All":
         filtered_weekday = filtered_weekday[filtered_weekday["month"] == selected_month]
         filtered_hourly = filtered_hourly[filtered_hourly["month"] == selected_month]
-        filtered_monthly = filtered_monthly[filtered_monthly["month"] == selected_month]
         stop_counts = stop_counts[stop_counts["month"] == selected_month]
 
     if selected_weekday != "All":
@@ -156,13 +223,11 @@ def main():
     if selected_route != "All":
         filtered_weekday = filtered_weekday[filtered_weekday["bus_route_id"] == selected_route]
         filtered_hourly = filtered_hourly[filtered_hourly["bus_route_id"] == selected_route]
-        filtered_monthly = filtered_monthly[filtered_monthly["bus_route_id"] == selected_route]
         stop_counts = stop_counts[stop_counts["bus_route_id"] == selected_route]
     
     if selected_violation != "All":
         filtered_weekday = filtered_weekday[filtered_weekday["violation_type"] == selected_violation]
         filtered_hourly = filtered_hourly[filtered_hourly["violation_type"] == selected_violation]
-        filtered_monthly = filtered_monthly[filtered_monthly["violation_type"] == selected_violation]
         stop_counts = stop_counts[stop_counts["violation_type"] == selected_violation]
 
     
@@ -190,7 +255,7 @@ def main():
 
     with chart_col1:
         chart1 = plot_weekday_violations(
-            filtered_weekday.groupby("weekday", as_index=False)["violations"].sum()
+            filtered_weekday.groupby("weekday", as_index=False, observed=True)["violations"].sum()
         )
         if chart1:
             st.altair_chart(chart1, use_container_width=True)
@@ -231,7 +296,7 @@ def main():
     with chart_col4:
         st.markdown("### 🔥 When Do Violations Spike?")
         heatmap_data = (
-            filtered_hourly.groupby(["weekday", "hour"], as_index=False)["violations"].sum()
+            filtered_hourly.groupby(["weekday", "hour"], as_index=False, observed=True)["violations"].sum()
         )
         heatmap_chart = plot_weekday_hour_heatmap(heatmap_data)
         if heatmap_chart: